@@ -2,68 +2,121 @@
 """Generate cron-events.json from multiple sources:
 - health-monitor-config.json (system cron jobs)
 - ~/.openclaw/cron/jobs.json (OpenClaw scheduled tasks)
-- systemd user timers
+- systemd user timers (only when AURORA_INCLUDE_SYSTEMD is set)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
-from datetime import datetime, timedelta
+import os
 from pathlib import Path
 import re
-import subprocess
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 CONFIG_PATH = Path.home() / "aurora" / "health-monitor-config.json"
 OPENCLAW_CRON_PATH = Path.home() / ".openclaw" / "cron" / "jobs.json"
 OUTPUT_PATH = Path.home() / "projects" / "aurora-health" / "dist" / "cron-events.json"
 
+# Schedule strings are dispatched on their frequency keyword, then searched
+# (anywhere, so "3am daily" works too) for an optional "<day> <h>[:<mm>]am|pm"
+# time or, for hourly schedules, a ":<mm>" offset
+_FREQUENCY_RE = re.compile(r'every\s+(?P<interval>\d+)\s*min|hourly|daily|weekly|monthly')
+_TIME_RE = re.compile(r'(?:(?P<day>\w+)\s+)?(?P<hour>\d+)(?::(?P<minute>\d+))?(?P<ampm>am|pm)')
+_MINUTE_PAST_RE = re.compile(r':(\d+)')
+
+# Common "*/N" minute fields mapped to (display, frequency)
+_CRON_INTERVAL = {
+    f"*/{n}": (f"every {n} min", f"every-{n}-min") for n in (1, 5, 10, 15, 30)
+}
+
+# 12-hour clock <-> 24-hour clock, e.g. (12, "am") -> 0 and 13 -> (1, "pm")
+_HOUR24 = (
+    {(h, "am"): h % 12 for h in range(1, 13)}
+    | {(h, "pm"): h % 12 + 12 for h in range(1, 13)}
+)
+_HOUR12 = {h: (h % 12 or 12, "am" if h < 12 else "pm") for h in range(24)}
+
+# Shared read-only defaults for .get() on parsed JSON; never mutate these
+_EMPTY_DICT: dict = {}
+_EMPTY_LIST: list = []
+
+# Turns "backup-sync" into "backup sync" for display names
+_DASH_TO_SPACE = str.maketrans("-", " ")
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+def _copy_schedule(schedule: dict) -> dict:
+    """Copy a cached schedule so callers never share its mutable parts."""
+    return {**schedule, "times": list(schedule["times"])}
+
+@lru_cache(maxsize=1440)
+def _format_daily(h: int, m: int) -> tuple[str, str]:
+    """Return the (display, "HH:MM") strings for a daily run at h:m."""
+    display_h, am_pm = _HOUR12[h]
+    return f"daily {display_h}:{m:02d}{am_pm}", f"{h:02d}:{m:02d}"
+
 def parse_cron_expression(cron_expr: str) -> dict:
     """Convert cron expression (e.g., '*/30 * * * *') to schedule format."""
-    parts = cron_expr.split()
-    if len(parts) != 5:
+    return _copy_schedule(_parse_cron_expression(cron_expr))
+
+@lru_cache(maxsize=512)
+def _parse_cron_expression(cron_expr: str) -> dict:
+    fields = cron_expr.split()
+    if len(fields) != 5:
         return {"display": cron_expr, "frequency": "unknown", "times": []}
     
-    minute, hour, day, month, weekday = parts
+    minute, hour, day, month, weekday = fields
     
-    # Check for every-X-minute patterns
-    if minute.startswith("*/"):
-        interval = minute[2:]
-        return {
-            "display": f"every {interval} min",
-            "frequency": f"every-{interval}-min",
-            "times": ["recurring"]
-        }
+    # Every-X-minute patterns: common intervals are a table lookup
+    interval = _CRON_INTERVAL.get(minute)
+    if interval is None and minute.startswith("*/"):
+        interval = (f"every {minute[2:]} min", f"every-{minute[2:]}-min")
+    if interval is not None:
+        display, frequency = interval
+        return {"display": display, "frequency": frequency, "times": ["recurring"]}
+    
+    # Hourly and daily patterns both need wildcard day/month/weekday fields
+    if (day, month, weekday) != ("*", "*", "*"):
+        return {"display": cron_expr, "frequency": "custom", "times": []}
     
     # Hourly pattern (specific minute each hour)
-    if hour == "*" and day == "*" and month == "*" and weekday == "*":
+    if hour == "*":
         return {
             "display": f"hourly :{minute.zfill(2)}",
             "frequency": "hourly",
             "times": [f":{minute.zfill(2)}"]
         }
     
-    # Daily pattern (specific time each day)
-    if day == "*" and month == "*" and weekday == "*":
-        h = int(hour) if hour != "*" else 0
-        m = int(minute) if minute != "*" else 0
-        time_str = f"{h:02d}:{m:02d}"
-        am_pm = "am" if h < 12 else "pm"
-        display_h = h if h <= 12 else h - 12
-        if display_h == 0:
-            display_h = 12
-        return {
-            "display": f"daily {display_h}:{m:02d}{am_pm}",
-            "frequency": "daily",
-            "times": [time_str]
-        }
+    # Daily pattern (specific time each day); ranges, lists and steps in
+    # the hour or minute field are left as custom
+    h = int(hour) if hour.isdigit() else -1
+    if h not in _HOUR12 or not (minute == "*" or minute.isdigit()):
+        return {"display": cron_expr, "frequency": "custom", "times": []}
     
-    # Default fallback
-    return {
-        "display": cron_expr,
-        "frequency": "custom",
-        "times": []
-    }
+    display, time_str = _format_daily(h, int(minute) if minute != "*" else 0)
+    return {"display": display, "frequency": "daily", "times": [time_str]}
 
 def parse_schedule(schedule_str: str) -> dict:
     """Convert human-readable schedule to structured format."""
+    return _copy_schedule(_parse_schedule(schedule_str))
+
+@lru_cache(maxsize=512)
+def _parse_schedule(schedule_str: str) -> dict:
     schedule = {
         "display": schedule_str,
         "frequency": "unknown",
@@ -71,158 +124,143 @@ def parse_schedule(schedule_str: str) -> dict:
     }
     
     s = schedule_str.lower()
+    if (match := _FREQUENCY_RE.search(s)) is None:
+        return schedule
     
-    if "every 5 min" in s:
-        schedule["frequency"] = "every-5-min"
+    freq = match.group()
+    if interval := match.group("interval"):
+        schedule["frequency"] = f"every-{interval}-min"
         schedule["times"] = ["recurring"]
-    elif "every 10 min" in s:
-        schedule["frequency"] = "every-10-min"
-        schedule["times"] = ["recurring"]
-    elif "every 15 min" in s:
-        schedule["frequency"] = "every-15-min"
-        schedule["times"] = ["recurring"]
-    elif "hourly" in s:
+    elif freq == "hourly":
         schedule["frequency"] = "hourly"
-        match = re.search(r':(\d+)', s)
-        schedule["times"] = [f":{match.group(1)}" if match else ":00"]
-    elif "daily" in s:
-        schedule["frequency"] = "daily"
-        # Try to match time with minutes first (e.g., "3:30am")
-        match = re.search(r'(\d+):(\d+)(am|pm)', s)
-        if match:
-            hour = int(match.group(1))
-            minute = match.group(2)
-            if match.group(3) == "pm" and hour != 12:
-                hour += 12
-            elif match.group(3) == "am" and hour == 12:
-                hour = 0
-            schedule["times"] = [f"{hour:02d}:{minute}"]
-        else:
-            # Try to match time without minutes (e.g., "4am")
-            match = re.search(r'(\d+)(am|pm)', s)
-            if match:
-                hour = int(match.group(1))
-                if match.group(2) == "pm" and hour != 12:
-                    hour += 12
-                elif match.group(2) == "am" and hour == 12:
-                    hour = 0
-                schedule["times"] = [f"{hour:02d}:00"]
-    elif "weekly" in s:
-        schedule["frequency"] = "weekly"
-        # Try to match day + time with minutes
-        match = re.search(r'(\w+)\s+(\d+):(\d+)(am|pm)', s)
-        if match:
-            hour = int(match.group(2))
-            minute = match.group(3)
-            if match.group(4) == "pm" and hour != 12:
-                hour += 12
-            elif match.group(4) == "am" and hour == 12:
-                hour = 0
-            schedule["day"] = match.group(1).capitalize()
-            schedule["times"] = [f"{hour:02d}:{minute}"]
-        else:
-            # Try to match day + time without minutes
-            match = re.search(r'(\w+)\s+(\d+)(am|pm)', s)
-            if match:
-                hour = int(match.group(2))
-                if match.group(3) == "pm" and hour != 12:
-                    hour += 12
-                elif match.group(3) == "am" and hour == 12:
-                    hour = 0
-                schedule["day"] = match.group(1).capitalize()
-                schedule["times"] = [f"{hour:02d}:00"]
-    elif "monthly" in s:
-        schedule["frequency"] = "monthly"
-        # Try to match time with minutes
-        match = re.search(r'(\d+):(\d+)(am|pm)', s)
-        if match:
-            hour = int(match.group(1))
-            minute = match.group(2)
-            if match.group(3) == "pm" and hour != 12:
-                hour += 12
-            elif match.group(3) == "am" and hour == 12:
-                hour = 0
-            schedule["times"] = [f"{hour:02d}:{minute}"]
-        else:
-            # Try to match time without minutes
-            match = re.search(r'(\d+)(am|pm)', s)
-            if match:
-                hour = int(match.group(1))
-                if match.group(2) == "pm" and hour != 12:
-                    hour += 12
-                elif match.group(2) == "am" and hour == 12:
-                    hour = 0
-                schedule["times"] = [f"{hour:02d}:00"]
+        past = _MINUTE_PAST_RE.search(s)
+        schedule["times"] = [f":{past.group(1)}" if past else ":00"]
+    else:
+        schedule["frequency"] = freq
+        # One search handles both "3:30am" and "4am" times
+        if (time_match := _TIME_RE.search(s)) is None:
+            return schedule
+        hour, minute, ampm = time_match.group("hour", "minute", "ampm")
+        if (hour := _HOUR24.get((int(hour), ampm))) is not None:
+            schedule["times"] = [f"{hour:02d}:{minute or '00'}"]
+            if freq == "weekly" and time_match.group("day"):
+                schedule["day"] = time_match.group("day").capitalize()
     
     return schedule
 
+def load_system_cron_jobs():
+    """Load system cron jobs from health-monitor-config.json."""
+    jobs = []
+    try:
+        config = _json_loads(CONFIG_PATH.read_bytes())
+        
+        # Everything in scheduled-jobs, plus cron-type components elsewhere
+        for group_id, group in config.get("groups", _EMPTY_DICT).items():
+            for component in group.get("components", _EMPTY_LIST):
+                if "schedule" not in component:
+                    continue
+                if group_id != "scheduled-jobs" and component.get("type") != "system_cron":
+                    continue
+                jobs.append({
+                    "id": component["id"],
+                    "name": component["name"],
+                    "schedule": parse_schedule(component["schedule"]),
+                    "logfile": component.get("logfile", ""),
+                    "script": component.get("script", ""),
+                    "source": "system cron"
+                })
+    except Exception as e:
+        print(f"Warning: Failed to load system cron jobs: {e}")
+    
+    return jobs
+
 def load_openclaw_jobs():
     """Load OpenClaw scheduled jobs."""
     jobs = []
     try:
         if OPENCLAW_CRON_PATH.exists():
-            with open(OPENCLAW_CRON_PATH) as f:
-                data = json.load(f)
-                for job in data.get("jobs", []):
-                    if not job.get("enabled", True):
-                        continue
-                    
-                    schedule_data = job.get("schedule", {})
-                    if schedule_data.get("kind") == "cron":
-                        cron_expr = schedule_data.get("expr", "")
-                        jobs.append({
-                            "id": f"openclaw-{job['id'][:8]}",
-                            "name": job.get("name", "Unknown OpenClaw Job"),
-                            "schedule": parse_cron_expression(cron_expr),
-                            "source": "OpenClaw Scheduler",
-                            "description": job.get("description", "")
-                        })
+            data = _json_loads(OPENCLAW_CRON_PATH.read_bytes())
+            for job in data.get("jobs", _EMPTY_LIST):
+                if not job.get("enabled", True):
+                    continue
+                
+                schedule_data = job.get("schedule", _EMPTY_DICT)
+                if schedule_data.get("kind") == "cron":
+                    cron_expr = schedule_data.get("expr", "")
+                    jobs.append({
+                        "id": f"openclaw-{job['id'][:8]}",
+                        "name": job.get("name", "Unknown OpenClaw Job"),
+                        "schedule": parse_cron_expression(cron_expr),
+                        "source": "OpenClaw Scheduler",
+                        "description": job.get("description", "")
+                    })
     except Exception as e:
         print(f"Warning: Failed to load OpenClaw jobs: {e}")
     
     return jobs
 
+def _list_timer_units() -> list:
+    """List unit names from `systemctl --user list-timers --all`.
+    
+    Asks for JSON first; systemd versions whose list-timers has no --json
+    option reject it, and the text table is parsed instead.
+    """
+    import subprocess
+    
+    args = ["systemctl", "--user", "list-timers", "--all", "--no-pager"]
+    result = subprocess.run(
+        args + ["--json=short"],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+    if result.returncode == 0:
+        return [entry.get("unit", "") for entry in _json_loads(result.stdout)]
+    
+    result = subprocess.run(args, capture_output=True, text=True, timeout=5)
+    if result.returncode != 0:
+        return []
+    
+    units = []
+    # Skip header and footer
+    for line in result.stdout.strip().split("\n")[1:-2]:
+        parts = line.split()
+        # Timer name is usually the second to last column
+        if len(parts) >= 5 and parts[-2].endswith(".timer"):
+            units.append(parts[-2])
+    return units
+
 def load_systemd_timers():
-    """Load systemd user timers."""
+    """Load systemd user timers.
+    
+    Spawning systemctl is the slowest step of a run, so timers are only
+    listed when the AURORA_INCLUDE_SYSTEMD environment variable is set to
+    a non-empty value; otherwise no timers are returned.
+    """
+    if not os.environ.get("AURORA_INCLUDE_SYSTEMD"):
+        return []
+    
     timers = []
     try:
-        result = subprocess.run(
-            ["systemctl", "--user", "list-timers", "--all", "--no-pager"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            lines = result.stdout.strip().split("\n")
-            # Skip header and footer
-            for line in lines[1:-2]:
-                if not line.strip():
-                    continue
-                
-                parts = line.split()
-                if len(parts) < 5:
-                    continue
-                
-                # Extract timer name (usually second to last column)
-                timer_name = parts[-2] if parts[-2].endswith(".timer") else None
-                if not timer_name:
-                    continue
-                
-                # Skip snap timers (system-level)
-                if timer_name.startswith("snap."):
-                    continue
-                
-                timers.append({
-                    "id": f"timer-{timer_name.replace('.timer', '')}",
-                    "name": timer_name.replace(".timer", "").replace("-", " ").title(),
-                    "schedule": {
-                        "display": "systemd timer",
-                        "frequency": "timer",
-                        "times": []
-                    },
-                    "source": "systemd timer"
-                })
+        for timer_name in _list_timer_units():
+            if not timer_name.endswith(".timer"):
+                continue
+            
+            # Skip snap timers (system-level)
+            if timer_name.startswith("snap."):
+                continue
+            
+            base_name = timer_name[:-len(".timer")]
+            timers.append({
+                "id": f"timer-{base_name}",
+                "name": base_name.translate(_DASH_TO_SPACE).title(),
+                "schedule": {
+                    "display": "systemd timer",
+                    "frequency": "timer",
+                    "times": []
+                },
+                "source": "systemd timer"
+            })
     except Exception as e:
         print(f"Warning: Failed to load systemd timers: {e}")
     
@@ -230,55 +268,22 @@ def load_systemd_timers():
 
 def generate_events():
     """Generate cron events JSON from all sources."""
-    events = []
-    
-    # 1. Load from health-monitor-config.json (system cron)
-    try:
-        with open(CONFIG_PATH) as f:
-            config = json.load(f)
-        
-        # Extract scheduled jobs from config
-        scheduled = config.get("groups", {}).get("scheduled-jobs", {})
-        for component in scheduled.get("components", []):
-            if "schedule" in component:
-                events.append({
-                    "id": component["id"],
-                    "name": component["name"],
-                    "schedule": parse_schedule(component["schedule"]),
-                    "logfile": component.get("logfile", ""),
-                    "script": component.get("script", ""),
-                    "source": "system cron"
-                })
-        
-        # Also check other groups for cron-type components
-        for group_id, group in config.get("groups", {}).items():
-            if group_id == "scheduled-jobs":
-                continue
-            for component in group.get("components", []):
-                if component.get("type") == "system_cron" and "schedule" in component:
-                    events.append({
-                        "id": component["id"],
-                        "name": component["name"],
-                        "schedule": parse_schedule(component["schedule"]),
-                        "logfile": component.get("logfile", ""),
-                        "script": component.get("script", ""),
-                        "source": "system cron"
-                    })
-    except Exception as e:
-        print(f"Warning: Failed to load system cron jobs: {e}")
-    
-    # 2. Load OpenClaw scheduled jobs
-    openclaw_jobs = load_openclaw_jobs()
-    events.extend(openclaw_jobs)
+    # The three sources are independent and I/O bound (two file reads and a
+    # systemctl call), so load them side by side
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        system_cron_future = executor.submit(load_system_cron_jobs)
+        openclaw_future = executor.submit(load_openclaw_jobs)
+        systemd_future = executor.submit(load_systemd_timers)
     
-    # 3. Load systemd timers
-    systemd_timers = load_systemd_timers()
-    events.extend(systemd_timers)
+    system_cron_jobs = system_cron_future.result()
+    openclaw_jobs = openclaw_future.result()
+    systemd_timers = systemd_future.result()
+    events = system_cron_jobs + openclaw_jobs + systemd_timers
     
     output = {
-        "generated": datetime.now().isoformat(),
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
         "sources": {
-            "system_cron": len([e for e in events if e.get("source") == "system cron"]),
+            "system_cron": len(system_cron_jobs),
             "openclaw": len(openclaw_jobs),
             "systemd": len(systemd_timers),
             "total": len(events)
@@ -286,8 +291,8 @@ def generate_events():
         "events": events
     }
     
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(output, f, indent=2)
+    # Serialize once and hand the file a single write
+    OUTPUT_PATH.write_bytes(_json_dumps(output))
     
     print(f"Generated {len(events)} events to {OUTPUT_PATH}")
     print(f"  - System cron: {output['sources']['system_cron']}")